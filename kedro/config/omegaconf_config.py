@@ -1,19 +1,300 @@
 """This module provides ``kedro.config`` with the functionality to load one
 or more configuration files of yaml or json type from specified paths through OmegaConf.
 """
+import fnmatch
+import json
 import logging
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
 from glob import iglob
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Set  # noqa
-
-from omegaconf import OmegaConf
+from typing import (  # noqa
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
+
+import yaml
+from omegaconf import DictConfig, OmegaConf
+from yaml.constructor import ConstructorError
 from yaml.parser import ParserError
+from yaml.resolver import BaseResolver
 from yaml.scanner import ScannerError
 
 from kedro.config import AbstractConfigLoader, MissingConfigException
 
+try:
+    from omegaconf._yaml import get_yaml_loader
+except ImportError:  # pragma: no cover
+    from omegaconf._utils import get_yaml_loader  # type: ignore
+
 _config_logger = logging.getLogger(__name__)
 
+_CONFIG_FILE_SUFFIXES = (".yml", ".yaml", ".json")
+
+
+def _get_yaml_loader():
+    """Return the YAML loader ``OmegaConf.load`` parses files with: duplicate keys
+    within a mapping are not allowed, floats don't require a dot (e.g. ``1e3``),
+    timestamps are loaded as strings and, from ``OmegaConf`` 2.4, recursive aliases
+    and excessive alias expansion are rejected and the libyaml bindings are used.
+    """
+    loader = get_yaml_loader()
+    # Other libraries (e.g. ``anyconfig``) register their own mapping constructor on
+    # the shared PyYAML loaders, so make sure the loader's own is used.
+    loader.add_constructor(BaseResolver.DEFAULT_MAPPING_TAG, loader.construct_yaml_map)
+    return loader
+
+
+@lru_cache(maxsize=256)
+def _parse_config_file(
+    path: Path, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> Tuple[Dict[str, Any], bool]:
+    """Parse a configuration file into a plain container. The file's modification
+    time and size are only part of the cache key, so that the cached result is
+    invalidated as soon as the file changes on disk.
+
+    Config files are small, so the whole file is read with a single call and the
+    buffer handed to the parser, instead of letting it pull decoded chunks from
+    a text stream.
+    """
+    return _parse_config_data(path.read_bytes(), path.suffix == ".json")
+
+
+@lru_cache(maxsize=256)
+def _parse_config_data(data: bytes, is_json: bool) -> Tuple[Dict[str, Any], bool]:
+    """Parse the content of a configuration file into a plain container, and tell
+    whether it needs to be resolved through ``OmegaConf``. Caching on the content itself means
+    that files with identical content, e.g. the same config copied across
+    environments, are only parsed once. JSON files are parsed with a JSON parser
+    rather than as YAML.
+    """
+    if is_json:
+        config = json.loads(data, object_pairs_hook=_construct_json_object) or {}
+    else:
+        config = yaml.load(data, Loader=_get_yaml_loader()) or {}  # nosec
+    return config, _needs_resolving(config)
+
+
+def _construct_json_object(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Build a JSON object, rejecting duplicate keys like the YAML loader does."""
+    mapping: Dict[str, Any] = {}
+    for key, value in pairs:
+        if key in mapping:
+            raise ConstructorError(
+                "while constructing a mapping", None, f"found duplicate key {key}"
+            )
+        mapping[key] = value
+    return mapping
+
+
+def _needs_resolving(config: Any) -> bool:
+    """Whether a plain container holds a string with an ``OmegaConf`` interpolation
+    or a missing mandatory value (``???``). Containers shared through YAML aliases
+    are only inspected once.
+
+    Raises:
+        ConstructorError: If the container is recursive, which the YAML loader of
+            ``OmegaConf`` only rejects from version 2.4.
+    """
+    needs_resolving = False
+    inspected: Set[int] = set()
+    ancestors: Set[int] = set()
+
+    def _inspect(value: Any):
+        nonlocal needs_resolving
+        if isinstance(value, str):
+            needs_resolving = needs_resolving or "${" in value or value == "???"
+            return
+        if not isinstance(value, (dict, list)) or id(value) in inspected:
+            return
+        if id(value) in ancestors:
+            raise ConstructorError(
+                None, None, "YAML recursive aliases are not supported."
+            )
+        ancestors.add(id(value))
+        for each in value.values() if isinstance(value, dict) else value:
+            _inspect(each)
+        ancestors.remove(id(value))
+        inspected.add(id(value))
+
+    _inspect(config)
+    return needs_resolving
+
+
+def _copy_container(value: Any, _copies: Optional[Dict[int, Any]] = None) -> Any:
+    """Copy the dicts and lists of a plain container, sharing its scalars. Like with
+    ``copy.deepcopy``, containers shared through YAML aliases are only copied once,
+    and the copies are shared the same way.
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+    copies = {} if _copies is None else _copies
+    if id(value) not in copies:
+        if isinstance(value, dict):
+            copies[id(value)] = {
+                key: _copy_container(each, copies) for key, each in value.items()
+            }
+        else:
+            copies[id(value)] = [_copy_container(each, copies) for each in value]
+    return copies[id(value)]
+
+
+def _load_config_file(path: Path) -> Union[DictConfig, Dict[str, Any]]:
+    """Load a configuration file, reusing the parsed result of a previous load
+    when the file hasn't changed since. Only configuration which needs to be
+    resolved is loaded through ``OmegaConf``, any other is returned as a copy of
+    the plain container, which is much cheaper to build.
+
+    Raises:
+        ParserError: If config file contains invalid YAML or JSON syntax.
+    """
+    stat = path.stat()
+    try:
+        config, needs_resolving = _parse_config_file(
+            path, stat.st_mtime_ns, stat.st_size
+        )
+    except (ParserError, ScannerError) as exc:
+        line = exc.problem_mark.line  # type: ignore
+        cursor = exc.problem_mark.column  # type: ignore
+        raise ParserError(
+            f"Invalid YAML or JSON file {path}, unable to read line {line}, "
+            f"position {cursor}."
+        ) from exc
+    except json.JSONDecodeError as exc:
+        raise ParserError(
+            f"Invalid YAML or JSON file {path}, unable to read line {exc.lineno - 1}, "
+            f"position {exc.colno - 1}."
+        ) from exc
+    if needs_resolving:
+        return OmegaConf.create(config)
+    return _copy_container(config)
+
+
+def _to_container(config: Union[DictConfig, Dict[str, Any]]) -> Dict[str, Any]:
+    """Turn a loaded configuration into plain containers, resolving interpolations.
+
+    Raises:
+        MissingMandatoryValue: If the configuration contains a missing mandatory
+            value (``???``).
+    """
+    if isinstance(config, DictConfig):
+        return OmegaConf.to_container(  # type: ignore
+            config, resolve=True, throw_on_missing=True
+        )
+    return config
+
+
+# Match glob patterns case-insensitively where the filesystem is, like ``glob`` does
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+@lru_cache(maxsize=None)
+def _compile_glob_pattern(pattern: str) -> Optional[Tuple[Optional[Pattern], ...]]:
+    """Compile a recursive glob pattern into one regex per path component, with
+    ``None`` standing for a ``**`` component. The result is meant to be matched
+    with ``_match_glob_pattern`` against paths relative to the directory the
+    pattern is applied to.
+
+    Returns ``None`` for patterns pointing outside of that directory, which have
+    to be resolved with ``glob`` instead.
+    """
+    parts = pattern.split("/")
+    if pattern.startswith("/") or {".", ".."} & set(parts):
+        return None
+    return tuple(
+        None if part == "**" else re.compile(_translate_glob_part(part), _GLOB_FLAGS)
+        for part in parts
+    )
+
+
+def _translate_glob_part(part: str) -> str:
+    # Like ``glob``, don't match hidden names unless the pattern explicitly does
+    hidden_lookahead = "" if part.startswith(".") else r"(?!\.)"
+    return hidden_lookahead + fnmatch.translate(part)
+
+
+def _match_glob_pattern(
+    pattern_parts: Tuple[Optional[Pattern], ...], path_parts: Tuple[str, ...]
+) -> bool:
+    """Check if a relative path matches a pattern compiled by ``_compile_glob_pattern``,
+    following the semantics of ``glob.iglob(..., recursive=True)``: a component
+    only matches a single directory or file name, ``**`` matches any number of
+    them and hidden names are only matched by components starting with a dot.
+    Only files are matched, so a trailing ``**`` has to match at least one name,
+    as matching none would yield the directory it's applied to.
+    """
+    if not pattern_parts:
+        return not path_parts
+
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head is None:
+        for i in range(0 if rest else 1, len(path_parts) + 1):
+            if i and path_parts[i - 1].startswith("."):
+                return False
+            if _match_glob_pattern(rest, path_parts[i:]):
+                return True
+        return False
+
+    if not path_parts:
+        return False
+    return bool(head.match(path_parts[0])) and _match_glob_pattern(rest, path_parts[1:])
+
+
+class _DirIndex:
+    """Index of all the files in a directory and its subdirectories, built with a
+    single ``os.scandir`` walk, which config patterns are then matched against.
+
+    The ``os.DirEntry`` objects collected during the walk carry the file type, so
+    checking if an entry is a file doesn't need another ``stat`` call, and only
+    the paths found through a symlink need to be resolved.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+        self.entries: List[Tuple[Tuple[str, ...], Path]] = []
+        self._scan(self.root, (), via_symlink=False)
+
+    def _scan(self, dirpath: Path, dir_parts: Tuple[str, ...], via_symlink: bool):
+        try:
+            with os.scandir(dirpath) as entries:
+                dir_entries = list(entries)
+        except OSError:
+            return
+
+        for entry in dir_entries:
+            parts = dir_parts + (entry.name,)
+            path = dirpath / entry.name
+            is_symlink = via_symlink or entry.is_symlink()
+            # Like ``glob``, follow symlinks to directories, and skip the entries
+            # which can't be accessed, e.g. because of a symlink loop.
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                self._scan(path, parts, via_symlink=is_symlink)
+            elif entry.is_file():
+                self.entries.append((parts, path.resolve() if is_symlink else path))
+
+    def match(self, patterns: Iterable[Tuple[Optional[Pattern], ...]]) -> List[Path]:
+        """Return the resolved paths of the files matching any of the given patterns
+        compiled by ``_compile_glob_pattern``.
+        """
+        return [
+            path
+            for parts, path in self.entries
+            if any(_match_glob_pattern(pattern, parts) for pattern in patterns)
+        ]
+
 
 class OmegaConfLoader(AbstractConfigLoader):
     """Recursively scan directories (config paths) contained in ``conf_source`` for
@@ -145,13 +426,18 @@ class OmegaConfLoader(AbstractConfigLoader):
 
         # Load base env config
         base_path = str(Path(self.conf_source) / self.base_env)
-        base_config = self.load_and_merge_dir_config(base_path, patterns)
+        base_config = self._load_and_merge_dir_config(base_path, patterns)
         config = base_config
 
         # Load chosen env config
         run_env = self.env or self.default_run_env
         env_path = str(Path(self.conf_source) / run_env)
-        env_config = self.load_and_merge_dir_config(env_path, patterns)
+        env_config = self._load_and_merge_dir_config(env_path, patterns)
+
+        # Interpolations of the chosen env may refer to keys of base, which must
+        # then be part of the same ``OmegaConf`` config to resolve them.
+        if isinstance(env_config, DictConfig) and not isinstance(config, DictConfig):
+            config = OmegaConf.create(config)
 
         # Destructively merge the two env dirs. The chosen env will override base.
         common_keys = config.keys() & env_config.keys()
@@ -164,6 +450,7 @@ class OmegaConfLoader(AbstractConfigLoader):
             _config_logger.debug(msg, env_path, sorted_keys)
 
         config.update(env_config)
+        config = _to_container(config)
 
         if not config:
             raise MissingConfigException(
@@ -194,6 +481,13 @@ class OmegaConfLoader(AbstractConfigLoader):
         Returns:
             Resulting configuration dictionary.
 
+        """
+        return _to_container(self._load_and_merge_dir_config(conf_path, patterns))
+
+    def _load_and_merge_dir_config(self, conf_path: str, patterns: Iterable[str]):
+        """Load and merge the configuration files of a directory like
+        ``load_and_merge_dir_config``, leaving the configuration which needs to be
+        resolved loaded through ``OmegaConf``.
         """
         if not Path(conf_path).is_dir():
             raise MissingConfigException(
@@ -201,29 +495,33 @@ class OmegaConfLoader(AbstractConfigLoader):
                 f"or is not a valid directory: {conf_path}"
             )
 
-        paths = [
-            Path(each).resolve()
-            for pattern in patterns
-            for each in iglob(f"{str(conf_path)}/{pattern}", recursive=True)
-        ]
-        deduplicated_paths = set(paths)
-        config_files_filtered = [
-            path for path in deduplicated_paths if self._is_valid_config_path(path)
-        ]
-
-        config_per_file = {}
+        compiled_patterns = []
+        paths: List[Path] = []
+        for pattern in patterns:
+            compiled_pattern = _compile_glob_pattern(pattern)
+            if compiled_pattern is None:
+                paths.extend(
+                    path
+                    for path in (
+                        Path(each).resolve()
+                        for each in iglob(f"{str(conf_path)}/{pattern}", recursive=True)
+                    )
+                    if self._is_valid_config_path(path)
+                )
+            else:
+                compiled_patterns.append(compiled_pattern)
+
+        # Index the directory once and match all the patterns against that index,
+        # rather than traversing it again with ``glob`` for every pattern.
+        if compiled_patterns:
+            paths.extend(
+                path
+                for path in _DirIndex(conf_path).match(compiled_patterns)
+                if path.suffix in _CONFIG_FILE_SUFFIXES
+            )
+        config_files_filtered = list(set(paths))
 
-        for config_filepath in config_files_filtered:
-            try:
-                config = OmegaConf.load(config_filepath)
-                config_per_file[config_filepath] = config
-            except (ParserError, ScannerError) as exc:
-                line = exc.problem_mark.line  # type: ignore
-                cursor = exc.problem_mark.column  # type: ignore
-                raise ParserError(
-                    f"Invalid YAML or JSON file {config_filepath}, unable to read line {line}, "
-                    f"position {cursor}."
-                ) from exc
+        config_per_file = self._load_config_file_list(config_files_filtered)
 
         seen_file_to_keys = {
             file: set(config.keys()) for file, config in config_per_file.items()
@@ -233,34 +531,57 @@ class OmegaConfLoader(AbstractConfigLoader):
 
         if aggregate_config:
             if len(aggregate_config) > 1:
-                return dict(OmegaConf.merge(*aggregate_config))
-            return list(aggregate_config)[0]
+                if any(isinstance(config, DictConfig) for config in aggregate_config):
+                    return OmegaConf.merge(*aggregate_config)
+                # Files can't share top-level keys, so merging plain configs
+                # comes down to gathering their keys.
+                return {
+                    key: value
+                    for config in aggregate_config
+                    for key, value in config.items()
+                }
+            return next(iter(aggregate_config))
         return {}
 
+    @staticmethod
+    def _load_config_file_list(
+        paths: List[Path],
+    ) -> Dict[Path, Union[DictConfig, Dict[str, Any]]]:
+        """Load the given configuration files one after the other. Parsing them
+        holds the GIL, so loading them in a pool of threads doesn't make it faster.
+        """
+        return {path: _load_config_file(path) for path in paths}
+
     @staticmethod
     def _is_valid_config_path(path):
         """Check if given path is a file path and file type is yaml or json."""
-        return path.is_file() and path.suffix in [".yml", ".yaml", ".json"]
+        return path.is_file() and path.suffix in _CONFIG_FILE_SUFFIXES
 
     @staticmethod
     def _check_duplicates(seen_files_to_keys: Dict[Path, Set[Any]]):
         duplicates = []
 
-        filepaths = list(seen_files_to_keys.keys())
-        for i, filepath1 in enumerate(filepaths, 1):
-            config1 = seen_files_to_keys[filepath1]
-            for filepath2 in filepaths[i:]:
-                config2 = seen_files_to_keys[filepath2]
-
-                overlapping_keys = config1 & config2
-
-                if overlapping_keys:
-                    sorted_keys = ", ".join(sorted(overlapping_keys))
-                    if len(sorted_keys) > 100:
-                        sorted_keys = sorted_keys[:100] + "..."
-                    duplicates.append(
-                        f"Duplicate keys found in {filepath1} and {filepath2}: {sorted_keys}"
-                    )
+        # Single pass over all the keys, recording every file a key was already
+        # seen in, rather than intersecting the keys of every pair of files.
+        files_per_key: Dict[Any, List[Path]] = defaultdict(list)
+        overlapping_keys: Dict[Tuple[Path, Path], List[Any]] = defaultdict(list)
+        for filepath, keys in seen_files_to_keys.items():
+            for key in keys:
+                for seen_filepath in files_per_key[key]:
+                    overlapping_keys[(seen_filepath, filepath)].append(key)
+                files_per_key[key].append(filepath)
+
+        file_order = {filepath: i for i, filepath in enumerate(seen_files_to_keys)}
+        for filepath1, filepath2 in sorted(
+            overlapping_keys,
+            key=lambda pair: (file_order[pair[0]], file_order[pair[1]]),
+        ):
+            sorted_keys = ", ".join(sorted(overlapping_keys[(filepath1, filepath2)]))
+            if len(sorted_keys) > 100:
+                sorted_keys = sorted_keys[:100] + "..."
+            duplicates.append(
+                f"Duplicate keys found in {filepath1} and {filepath2}: {sorted_keys}"
+            )
 
         if duplicates:
             dup_str = "\n".join(duplicates)
@@ -162,7 +162,8 @@ def create_catalog(metadata: ProjectMetadata, pipeline_name, env):
 
 def _add_missing_datasets_to_catalog(missing_ds, catalog_path):
     if catalog_path.is_file():
-        catalog_config = yaml.safe_load(catalog_path.read_text()) or {}
+        with catalog_path.open(mode="rb") as catalog_file:
+            catalog_config = yaml.safe_load(catalog_file) or {}
     else:
         catalog_config = {}
 
@@ -1,6 +1,5 @@
 from random import random
 
-import pandas as pd
 import pytest
 
 from kedro.io import DataCatalog, LambdaDataSet, MemoryDataSet
@@ -47,9 +46,17 @@ def conflicting_feed_dict(pandas_df_feed_dict):
     return {"ds1": ds1, "ds3": ds3}
 
 
+@pytest.fixture(scope="module")
+def pandas_df():
+    """Shared by the tests of a module, which must not modify it. Data sets created
+    from it through ``add_feed_dict`` hold their own copy."""
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    return pd.DataFrame({"Name": ["Alex", "Bob"], "Age": [15, 25]})
+
+
 @pytest.fixture
-def pandas_df_feed_dict():
-    pandas_df = pd.DataFrame({"Name": ["Alex", "Bob"], "Age": [15, 25]})
+def pandas_df_feed_dict(pandas_df):
     return {"ds3": pandas_df}
 
 
@@ -1,7 +1,7 @@
 import re
-from typing import Any, Dict
+from array import array
+from typing import Any, Dict, Iterator, List, Tuple
 
-import pandas as pd
 import pytest
 
 from kedro.framework.hooks import _create_hook_manager
@@ -27,7 +27,9 @@ class TestValidSequentialRunner:
         assert result["Z"] == (42, 42, 42)
 
 
-@pytest.mark.parametrize("is_async", [False, True])
+@pytest.mark.parametrize(
+    "is_async", [False, pytest.param(True, marks=pytest.mark.slow)]
+)
 class TestSeqentialRunnerBranchlessPipeline:
     def test_no_input_seq(self, is_async, branchless_no_input_pipeline, catalog):
         outputs = SequentialRunner(is_async=is_async).run(
@@ -76,7 +78,9 @@ class TestSeqentialRunnerBranchlessPipeline:
         assert output == {}
 
 
-@pytest.mark.parametrize("is_async", [False, True])
+@pytest.mark.parametrize(
+    "is_async", [False, pytest.param(True, marks=pytest.mark.slow)]
+)
 class TestSequentialRunnerBranchedPipeline:
     def test_input_seq(
         self,
@@ -85,6 +89,8 @@ class TestSequentialRunnerBranchedPipeline:
         unfinished_outputs_pipeline,
         pandas_df_feed_dict,
     ):
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         memory_catalog.add_feed_dict(pandas_df_feed_dict, replace=True)
         outputs = SequentialRunner(is_async=is_async).run(
             unfinished_outputs_pipeline, memory_catalog
@@ -106,6 +112,8 @@ class TestSequentialRunnerBranchedPipeline:
         conflicting_feed_dict,
     ):
         """ds1 and ds3 will be replaced with new inputs."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         memory_catalog.add_feed_dict(conflicting_feed_dict, replace=True)
         outputs = SequentialRunner(is_async=is_async).run(
             unfinished_outputs_pipeline, memory_catalog
@@ -122,102 +130,190 @@ class TestSequentialRunnerBranchedPipeline:
             )
 
 
+class ActionLog:
+    """Log of the actions run on ``LoggingDataSet``s, kept as two parallel arrays
+    of action codes and data set names instead of a list of tuples. It still
+    compares equal to the equivalent list of ``(action, name)`` tuples.
+    """
+
+    _ACTIONS = ("load", "release")
+    LOAD, RELEASE = range(len(_ACTIONS))
+
+    def __init__(self):
+        self.actions = array("B")
+        self.names: List[str] = []
+
+    def append(self, action: int, name: str) -> None:
+        self.actions.append(action)
+        self.names.append(name)
+
+    def clear(self) -> None:
+        del self.actions[:]
+        self.names.clear()
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return (
+            (self._ACTIONS[action], name)
+            for action, name in zip(self.actions, self.names)
+        )
+
+    def __eq__(self, other) -> bool:
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class LoggingDataSet(AbstractDataSet):
     def __init__(self, log, name, value=None):
         self.log = log
         self.name = name
         self.value = value
+        self._initial_value = value
 
     def _load(self) -> Any:
-        self.log.append(("load", self.name))
+        self.log.append(ActionLog.LOAD, self.name)
         return self.value
 
     def _save(self, data: Any) -> None:
         self.value = data
 
     def _release(self) -> None:
-        self.log.append(("release", self.name))
+        self.log.append(ActionLog.RELEASE, self.name)
         self.value = None
 
     def _describe(self) -> Dict[str, Any]:
         return {}
 
+    def reset(self) -> None:
+        """Clear the shared log and restore the initial value of the data set."""
+        self.log.clear()
+        self.value = self._initial_value
+
 
-@pytest.mark.parametrize("is_async", [False, True])
+@pytest.fixture(scope="class")
+def logging_data_sets():
+    log = ActionLog()
+    return {
+        "in": LoggingDataSet(log, "in", "stuff"),
+        "middle": LoggingDataSet(log, "middle"),
+        "out": LoggingDataSet(log, "out"),
+        "first": LoggingDataSet(log, "first"),
+        "second": LoggingDataSet(log, "second"),
+        "dataset": LoggingDataSet(log, "dataset"),
+        "ds@save": LoggingDataSet(log, "save"),
+        "ds@load": LoggingDataSet(log, "load"),
+    }
+
+
+@pytest.fixture(scope="class")
+def logging_catalog(logging_data_sets):
+    """A single catalog reused by all the tests of a class. Runners only work
+    on a shallow copy of it, so only the state of the data sets has to be reset
+    between tests, see ``logging_log``."""
+    return DataCatalog(logging_data_sets)
+
+
+@pytest.fixture
+def logging_log(logging_data_sets):
+    for data_set in logging_data_sets.values():
+        data_set.reset()
+    return logging_data_sets["in"].log
+
+
+@pytest.fixture(scope="class")
+def inputs_outputs_pipeline():
+    return pipeline([node(identity, "in", "middle"), node(identity, "middle", "out")])
+
+
+@pytest.fixture(scope="class")
+def earliest_release_pipeline():
+    return pipeline(
+        [
+            node(source, None, "first"),
+            node(identity, "first", "second"),
+            node(sink, "second", None),
+        ]
+    )
+
+
+@pytest.fixture(scope="class")
+def multiple_loads_pipeline():
+    return pipeline(
+        [
+            node(source, None, "dataset"),
+            node(sink, "dataset", None, name="bob"),
+            node(sink, "dataset", None, name="fred"),
+        ]
+    )
+
+
+@pytest.fixture(scope="class")
+def transcoded_pipeline():
+    return pipeline([node(source, None, "ds@save"), node(sink, "ds@load", None)])
+
+
+@pytest.mark.parametrize(
+    "is_async", [False, pytest.param(True, marks=pytest.mark.slow)]
+)
 class TestSequentialRunnerRelease:
-    def test_dont_release_inputs_and_outputs(self, is_async):
-        log = []
-        test_pipeline = pipeline(
-            [node(identity, "in", "middle"), node(identity, "middle", "out")]
-        )
-        catalog = DataCatalog(
-            {
-                "in": LoggingDataSet(log, "in", "stuff"),
-                "middle": LoggingDataSet(log, "middle"),
-                "out": LoggingDataSet(log, "out"),
-            }
+    def test_dont_release_inputs_and_outputs(
+        self, is_async, inputs_outputs_pipeline, logging_catalog, logging_log
+    ):
+        SequentialRunner(is_async=is_async).run(
+            inputs_outputs_pipeline, logging_catalog
         )
-        SequentialRunner(is_async=is_async).run(test_pipeline, catalog)
 
         # we don't want to see release in or out in here
-        assert log == [("load", "in"), ("load", "middle"), ("release", "middle")]
-
-    def test_release_at_earliest_opportunity(self, is_async):
-        log = []
-        test_pipeline = pipeline(
-            [
-                node(source, None, "first"),
-                node(identity, "first", "second"),
-                node(sink, "second", None),
-            ]
-        )
-        catalog = DataCatalog(
-            {
-                "first": LoggingDataSet(log, "first"),
-                "second": LoggingDataSet(log, "second"),
-            }
+        assert logging_log == [
+            ("load", "in"),
+            ("load", "middle"),
+            ("release", "middle"),
+        ]
+
+    def test_release_at_earliest_opportunity(
+        self, is_async, earliest_release_pipeline, logging_catalog, logging_log
+    ):
+        SequentialRunner(is_async=is_async).run(
+            earliest_release_pipeline, logging_catalog
         )
-        SequentialRunner(is_async=is_async).run(test_pipeline, catalog)
 
         # we want to see "release first" before "load second"
-        assert log == [
+        assert logging_log == [
             ("load", "first"),
             ("release", "first"),
             ("load", "second"),
             ("release", "second"),
         ]
 
-    def test_count_multiple_loads(self, is_async):
-        log = []
-        test_pipeline = pipeline(
-            [
-                node(source, None, "dataset"),
-                node(sink, "dataset", None, name="bob"),
-                node(sink, "dataset", None, name="fred"),
-            ]
+    def test_count_multiple_loads(
+        self, is_async, multiple_loads_pipeline, logging_catalog, logging_log
+    ):
+        SequentialRunner(is_async=is_async).run(
+            multiple_loads_pipeline, logging_catalog
         )
-        catalog = DataCatalog({"dataset": LoggingDataSet(log, "dataset")})
-        SequentialRunner(is_async=is_async).run(test_pipeline, catalog)
 
         # we want to the release after both the loads
-        assert log == [("load", "dataset"), ("load", "dataset"), ("release", "dataset")]
-
-    def test_release_transcoded(self, is_async):
-        log = []
-        test_pipeline = pipeline(
-            [node(source, None, "ds@save"), node(sink, "ds@load", None)]
-        )
-        catalog = DataCatalog(
-            {
-                "ds@save": LoggingDataSet(log, "save"),
-                "ds@load": LoggingDataSet(log, "load"),
-            }
-        )
+        assert logging_log == [
+            ("load", "dataset"),
+            ("load", "dataset"),
+            ("release", "dataset"),
+        ]
 
-        SequentialRunner(is_async=is_async).run(test_pipeline, catalog)
+    def test_release_transcoded(
+        self, is_async, transcoded_pipeline, logging_catalog, logging_log
+    ):
+        SequentialRunner(is_async=is_async).run(transcoded_pipeline, logging_catalog)
 
         # we want to see both datasets being released
-        assert log == [("release", "save"), ("load", "load"), ("release", "load")]
+        assert logging_log == [
+            ("release", "save"),
+            ("load", "load"),
+            ("release", "load"),
+        ]
 
     @pytest.mark.parametrize(
         "test_pipeline",